@@ -0,0 +1,92 @@
+# cython: language_level=3
+"""
+    C implementation of `pdKernel` (see `pd_numba.py`), used by `main.py`
+    when Numba is not installed. Build with: `python setup.py build_ext --inplace`
+"""
+import numpy as np
+cimport cython
+from libc.stdint cimport int8_t, int32_t, int64_t, INT64_MAX
+
+cdef extern from *:
+    int __builtin_ctzll(unsigned long long x) nogil
+
+
+ctypedef fused table_t:
+    int32_t
+    int64_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void pd_kernel(const int64_t[::1] p, const int64_t[::1] w,
+                    const int64_t[::1] d, table_t[::1] table,
+                    int64_t[::1] T, int8_t[::1] parent,
+                    int64_t[::1] order, int64_t ub) noexcept nogil:
+    """
+        Same algorithm as in `pd_numba.pdKernel`, combinations are computed
+        sequentially in increasing order of their ids (every subset of `i` is
+        smaller than `i`). Writes task's indices in optimized order to `order`.
+    """
+    cdef Py_ssize_t N = p.shape[0]
+    cdef Py_ssize_t size = (<Py_ssize_t>1) << N
+    cdef Py_ssize_t i, lb, rem, pos
+    cdef int k, bestK
+    cdef int64_t time, diff, penalty, best
+
+    table[0] = 0
+    T[0] = 0
+    for i in range(1, size):
+        lb = i & -i
+        T[i] = T[i ^ lb] + p[__builtin_ctzll(lb)]
+
+    for i in range(1, size):
+        time = T[i]
+        best, bestK = INT64_MAX, 0
+        # go through set bits of `i` only: `lb` - lowest task left in `rem`
+        rem = i
+        while rem:
+            lb = rem & -rem
+            k = __builtin_ctzll(lb)
+            diff = time - d[k]
+            penalty = table[i ^ lb] + (w[k] * diff if diff > 0 else 0)
+
+            # on ties the largest `k` is kept (scan goes up in `k`)
+            if best >= penalty:
+                best = penalty
+                bestK = k
+            rem ^= lb
+        # bounded by `ub + 1`, see `pd_numba.pdKernel`
+        table[i] = <table_t>(best if best <= ub else ub + 1)
+        parent[i] = bestK
+
+    i = size - 1
+    for pos in range(N - 1, -1, -1):
+        k = parent[i]
+        order[pos] = k
+        i ^= (<Py_ssize_t>1) << k
+
+
+def pdKernel(const int64_t[::1] p, const int64_t[::1] w,
+             const int64_t[::1] d, table_t[::1] table, int64_t ub):
+    """
+        PD algorithm for PWD problem solving, see `pd_numba.pdKernel`.
+
+        Params:
+        - `p, w, d` - parameters of tasks to optimize (`np.int64` arrays)
+        - `table` - buffer of size `2**N` for penalties (`np.int32` or
+            `np.int64`, see `main.pd_algorithm`)
+        - `ub` - penalty of any known order
+
+        Returns:
+        - `np.ndarray` - array of task's indices in optimized order
+    """
+    cdef Py_ssize_t N = p.shape[0]
+    cdef Py_ssize_t size = (<Py_ssize_t>1) << N
+    cdef int64_t[::1] T = np.empty(size, dtype=np.int64)
+    cdef int8_t[::1] parent = np.empty(size, dtype=np.int8)
+    order = np.empty(N, dtype=np.int64)
+    cdef int64_t[::1] orderView = order
+
+    with nogil:
+        pd_kernel(p, w, d, table, T, parent, orderView, ub)
+    return order
@@ -1,169 +1,92 @@
 import time
-import math
 import numpy as np
-from typing import List
+from typing import Tuple
 
-class Task:
-    """
-        Class repesenting `Task` object for PWD problem.
-    """
-    def __init__(self, id: int, p: int, w: int, d: int) -> None:
-        """
-            - `id: int` - task's id based on the order in the dataset
-            - `p: int` - tasks execution time
-            - `w: int` - 'weight' or cost per one unit of delay
-            - `d: int` - task's completion deadline
-        """
-        self.id = id
-        self.p = p
-        self.w = w
-        self.d = d
-    
-    def __repr__(self):
-        return f"{self.id} {self.p} {self.w} {self.d}"
+try:
+    # parallel kernel, see `pd_numba.py`
+    from pd_numba import pdKernel
+except ImportError:
+    # single-threaded C extension for machines without Numba, 
+    # see `_pd_algo.pyx`
+    from _pd_algo import pdKernel
 
-def readData(filepath: str) -> List[Task]:
+def readData(filepath: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, 
+                                      np.ndarray]:
     """
-        Read data from a ".txt" file and return an indexed array.
+        Read data from a ".txt" file and return task's parameters as separate
+        contiguous arrays (one array per parameter).
         
         Parameters:
         - `filepath: str` - path to the data file
         
         Returns:
-        - `List[Task]` - array of `Task` objects
+        - `Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]` - arrays
+            `(ids, p, w, d)` of type `np.int64`, where:
+            - `ids` - task's ids based on the order in the dataset
+            - `p` - tasks execution times
+            - `w` - 'weights' or costs per one unit of delay
+            - `d` - task's completion deadlines
     """
     with open(filepath) as file:
-        data = file.readlines()
+        # get number of elements from data - first line of the file
+        nItems = int(file.readline())
+        data = np.loadtxt(file, dtype=np.int64, ndmin=2)
+    ids = np.arange(0, nItems, dtype=np.int64)
+    # one transposed copy - every row is a contiguous column of the file
+    p, w, d = np.ascontiguousarray(data.T)
     
-    # remove newlines and split data items
-    data = [l.strip().split(" ") for l in data]
-    # get number of elements from data - first line of the file
-    nItems = int(data[0][0])
-    data = np.asarray(data[1:], dtype=np.int64) # convert str to int
-    indices = np.arange(0, nItems).reshape(nItems, 1)
-    data = np.hstack((indices, data))
-    items = []
-    for d in data:
-        items.append(Task(d[0], d[1], d[2], d[3]))
-    
-    return items
+    return ids, p, w, d
 
-def printData(data: List[Task]) -> None:
+def printData(ids: np.ndarray, p: np.ndarray, w: np.ndarray, 
+              d: np.ndarray) -> None:
     """
-        Print array `data` of `Task` elements. 
+        Print tasks given by the arrays `ids`, `p`, `w`, `d`. 
         
         Created for conveniense.
         Params:
-        - `data:  List[Task]` - array of `Task` objects
+        - `ids, p, w, d: np.ndarray` - arrays returned by `readData`
     """
     print("-----------------")
-    for item in data:
-        print(item)
+    for item in zip(ids, p, w, d):
+        print(*item)
     print("-----------------")
 
-def getPenalty(data: List[Task]) -> int:
+def getPenalty(p: np.ndarray, w: np.ndarray, d: np.ndarray, 
+               order: np.ndarray) -> int:
     """
-        Get total penalty for `data` in provided order.
+        Get total penalty for tasks in provided order.
         
         Params:
-        - `data: List[Task]` - array of `Task` objects. Penalty is calculated
-            for the order given by this array.
+        - `p, w, d: np.ndarray` - task's parameters
+        - `order: np.ndarray` - task's indices. Penalty is calculated for the
+            order given by this array.
         
         Returns:
         - `int` - total penalty value
     """
-    data = np.asarray(data.copy())
-    if len(data) < 1:
-        return 0
-    t = 0
-    penalty = 0
-    for item in data:
-        t += item.p
-        penalty += getTaskPenalty(item, t)
-    return penalty
-
-def getTaskPenalty(task: Task, t: int) -> None:
-    """
-        Get penalty value for a given task at a given time.
-        
-        Params:
-        - `task: Task` - `Task` object to caltulcate penalty for
-        - `t: int` - time to calculate amount of delay
-        
-        Returns:
-        - `int` - penalty value
-    """
-    return task.w * (t - task.d) if t>task.d else 0
-
-def getTotalTime(data: List[Task], orderID: int) -> int:
-    """
-        Get total time needed to complete set of tasks in the order, specified 
-        by the `orderID`. Ex.:  
-        
-        `orderID = 3 = (0011)_2`; `i` in `[0, len(data))`  
-        
-        `1 << i` produces values `0001`, `0010`, `0100` etc. Next, bitwise AND 
-        operation is used to see if task with id `1 << i` is in the order
-        
-        Params:
-        - `data: List[Task]` - 
-        - `orderID: int` - id of the tasks order `[0, 2**len(data))`
-        
-        Returns:
-        - `int` - total completion time
-    """
-    sum = 0
-    for i in range(len(data)):
-        if (1 << i) & orderID:
-            sum += data[i].p
-    return sum
+    t = np.cumsum(p[order])
+    return int(np.maximum(0, t - d[order]) @ w[order])
 
-def PD_Algorithm(data: List[Task]) -> List[int]:
+def pd_algorithm(p: np.ndarray, w: np.ndarray, d: np.ndarray) -> np.ndarray:
     """
-        PD algorithm for PWD problem solving.
-        `N` is the number of tasks in `data` array. Number of possible tasks
-        combinations is `2**N`. Array `table` contains smallest possible penalty
-        value for a given task combination. Indicies in `table` are in range 
-        `[0, 2**N]` (index `0` - no tasks are taken, index `2**N-1 - all tasks).
-        Algorithm goes through all possible combinations finding optimal order, 
-        which is then being saved to `table_order`, where every element with
-        indicies `[0, 2**N]` contains `List[int]`. This array corresponds to
-        task's ids in optimal order. 
+        PD algorithm for PWD problem solving (see `pd_numba.pdKernel`).
+        Upper bound for the kernel is the penalty of EDD (earliest due date 
+        first) order. Table's values never exceed `ub + 1`, so if it fits, 
+        `np.int32` table is used - half the memory traffic of `np.int64`.
         
         Params:
-        - `data: List[Task]` - array of tasks to optimize
+        - `p, w, d: np.ndarray` - parameters of tasks to optimize (converted 
+            to contiguous `np.int64` arrays required by the kernels)
         
         Returns:
-        - `List[int]` - array of task's ids in optimized order
-    """
-    N = len(data)
-    table = [0] + [math.inf for _ in range(2**N-1)]
-    table_order = [[] for _ in range(2**N)]
-
-    for i in range(1, 2**N):
-        time = getTotalTime(data, i)
-        k, j, index = 0, 1, 0
-        while (j <= i):
-            if i & j:
-                prev = table[i-j]
-                penalty = getTaskPenalty(data[k], time)
-                if not math.isinf(prev):
-                    penalty += prev
-                
-                if table[i] > penalty:
-                    table[i] = penalty
-                    table_order[i] = table_order[i-j][:]
-                    index = k
-                elif (table[i] == penalty) and (table_order[i] > table_order[i-j]):
-                    table_order[i] = table_order[i-j][:]
-                    index = k
-            j <<= 1
-            k += 1
-            
-        table_order[i].append(data[index].id)
-        
-    return table_order[-1]
-
+        - `np.ndarray` - array of task's indices in optimized order
+    """
+    p, w, d = (np.ascontiguousarray(x, dtype=np.int64) for x in (p, w, d))
+    edd = np.argsort(d, kind="stable")
+    ub = getPenalty(p, w, d, edd)
+    fitsInt32 = ub < np.iinfo(np.int32).max
+    table = np.empty(1 << len(p), dtype=np.int32 if fitsInt32 else np.int64)
+    return pdKernel(p, w, d, table, ub)
 
 def calculate_time(func):
     """
@@ -191,14 +114,14 @@ def testSolution(filename: str) -> None:
             - N line: task described with 3 `int`s separated by spaces: "p w d"
     """
     filepath = f"data/{filename}"
-    data = readData(filepath)
+    ids, p, w, d = readData(filepath)
     print(f"DATASET : {filename}")
-    # printData(data)
-    order = PD_Algorithm(data)
-    totalPenalty = getPenalty(np.array(data)[order])
+    # printData(ids, p, w, d)
+    order = pd_algorithm(p, w, d)
+    totalPenalty = getPenalty(p, w, d, order)
     
     print(f"Total penalty: {totalPenalty}")
-    print(f"Order: {" ".join([str(item + 1) for item in order])}")
+    print(f"Order: {' '.join([str(item + 1) for item in ids[order]])}")
 
 def testMultiple(filenames):
     for filename in filenames:
@@ -0,0 +1,156 @@
+import numpy as np
+from numba import njit, prange, int8, int32, int64
+from numba.types import UniTuple
+from numba.cpython.unsafe.numbers import trailing_zeros
+from typing import Tuple
+
+@njit(int64(int64), cache=True)
+def lowBitIndex(lb: int) -> int:
+    """
+        Get index `k` of the lowest set bit in `lb` (count trailing zeros).
+        Compiles to a single `tzcnt`/`bsf` instruction on x86-64.
+    """
+    return trailing_zeros(lb)
+
+@njit(int64[::1](int64[::1]), cache=True)
+def getTotalTimes(p: np.ndarray) -> np.ndarray:
+    """
+        Get total time needed to complete every set of tasks (order id in 
+        `[0, 2**len(p))`). Times are computed with the recurrence:
+        
+        `T[i] = T[i ^ lb] + p[k]`, where `lb = i & -i = 1 << k` is the lowest
+        set bit of `i`, i.e. the set `i` without its lowest task has already
+        been computed. Ex.: `T[(0110)_2] = T[(0100)_2] + p[1]`
+        
+        Params:
+        - `p: np.ndarray` - tasks execution times
+        
+        Returns:
+        - `np.ndarray` - total completion time for every order id
+    """
+    T = np.empty(1 << len(p), dtype=np.int64)
+    T[0] = 0
+    for i in range(1, len(T)):
+        lb = i & -i
+        T[i] = T[i ^ lb] + p[lowBitIndex(lb)]
+    return T
+
+@njit(int64[::1](int8[::1], int64), cache=True)
+def unwindOrder(parent: np.ndarray, N: int) -> np.ndarray:
+    """
+        Reconstruct optimal order of all `N` tasks by walking the `parent` 
+        array: `parent[i]` is the index of the last task in the optimal order
+        of combination `i`, so the rest of the order is stored under 
+        `i ^ (1 << parent[i])`.
+        
+        Params:
+        - `parent: np.ndarray` - last task's index for every combination
+        - `N: int` - number of tasks
+        
+        Returns:
+        - `np.ndarray` - array of task's indices in optimal order
+    """
+    order = np.empty(N, dtype=np.int64)
+    i = (1 << N) - 1
+    for pos in range(N - 1, -1, -1):
+        k = parent[i]
+        order[pos] = k
+        i ^= 1 << k
+    return order
+
+@njit(UniTuple(int64[::1], 2)(int64), cache=True)
+def getLevels(N: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+        Group order ids `[0, 2**N)` by the number of tasks in them (popcount).
+        Combinations with `c` tasks depend only on combinations with `c-1`
+        tasks, so every group can be computed in parallel. Ex. for `N = 2`:
+        `levels = [0, 1, 2, 3]`, `starts = [0, 1, 3, 4]`
+        
+        Params:
+        - `N: int` - number of tasks
+        
+        Returns:
+        - `Tuple[np.ndarray, np.ndarray]` - `(levels, starts)`, where order ids
+            with `c` tasks are `levels[starts[c]:starts[c+1]]`
+    """
+    count = np.empty(1 << N, dtype=np.int8)
+    count[0] = 0
+    starts = np.zeros(N + 2, dtype=np.int64)
+    starts[1] = 1
+    for i in range(1, 1 << N):
+        count[i] = count[i & (i - 1)] + 1
+        starts[count[i] + 1] += 1
+    for c in range(1, N + 2):
+        starts[c] += starts[c - 1]
+    
+    levels = np.empty(1 << N, dtype=np.int64)
+    pos = starts[:-1].copy()
+    for i in range(1 << N):
+        levels[pos[count[i]]] = i
+        pos[count[i]] += 1
+    return levels, starts
+
+@njit([int64[::1](int64[::1], int64[::1], int64[::1], int32[::1], int64),
+       int64[::1](int64[::1], int64[::1], int64[::1], int64[::1], int64)],
+      cache=True, parallel=True)
+def pdKernel(p: np.ndarray, w: np.ndarray, d: np.ndarray, table: np.ndarray,
+             ub: int) -> np.ndarray:
+    """
+        PD algorithm for PWD problem solving.
+        `N` is the number of tasks in `p`, `w`, `d` arrays. Number of possible
+        tasks combinations is `2**N`. Array `table` contains smallest possible
+        penalty value for a given task combination. Indicies in `table` are in
+        range `[0, 2**N]` (index `0` - no tasks are taken, index `2**N-1 - all
+        tasks). Algorithm goes through all possible combinations level by
+        level (see `getLevels`), combinations of one level are computed in
+        parallel. Instead of storing the whole order for every combination,
+        only index of its last task is saved to `parent`; optimal order is
+        reconstructed at the end by `unwindOrder`. If several tasks give the
+        same penalty, the one with the largest index is taken as the last one.
+        Penalties are bounded by `ub + 1`: a combination above upper bound 
+        `ub` can't be a part of the optimal order, so its exact value doesn't
+        matter and `ub + 1` is stored instead (orders built on it stay above 
+        `ub` as well). This keeps table's values small enough for `np.int32`;
+        every combination is still computed.
+        
+        Params:
+        - `p, w, d: np.ndarray` - parameters of tasks to optimize
+            (`np.int64` arrays)
+        - `table: np.ndarray` - buffer of size `2**N` for penalties 
+            (`np.int32` or `np.int64`, see `main.pd_algorithm`)
+        - `ub: int` - penalty of any known order
+        
+        Returns:
+        - `np.ndarray` - array of task's indices in optimized order
+    """
+    N = len(p)
+    INF = np.iinfo(np.int64).max
+    table[0] = 0
+    parent = np.empty(1 << N, dtype=np.int8) # every `i > 0` is written below
+    T = getTotalTimes(p)
+    levels, starts = getLevels(N)
+
+    for c in range(1, N + 1):
+        for idx in prange(starts[c], starts[c + 1]):
+            i = levels[idx]
+            time = T[i]
+            best, bestK = INF, 0
+            # go through set bits of `i` only: `lb` - lowest task left in `rem`
+            rem = i
+            while rem:
+                lb = rem & -rem
+                k = lowBitIndex(lb)
+                # `table[i ^ lb]` is on the previous level, already computed.
+                # Select form of `max` compiles to `cmov`
+                diff = time - d[k]
+                penalty = table[i ^ lb] + (w[k] * diff if diff > 0 else 0)
+                
+                # on ties the largest `k` is kept (scan goes up in `k`)
+                if best >= penalty:
+                    best = penalty
+                    bestK = k
+                rem ^= lb
+            table[i] = min(best, ub + 1)
+            parent[i] = bestK
+        
+    return unwindOrder(parent, N)
@@ -0,0 +1,11 @@
+"""
+    Build C extension with the PD algorithm kernel:
+    `python setup.py build_ext --inplace`
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="pd_algo",
+    ext_modules=cythonize("_pd_algo.pyx"),
+)